@@ -1,13 +1,18 @@
 import logging
-import random
-from heapq import heappush as hpush
 from typing import Dict, List, Tuple
 
 import yaml
+from util.aliases import debug_enabled, rand
 from util.exceptions import BuildConfigError
 
 hunter_name_spacing: int = 7
 
+# bit flags of the on creation effects that a hunter applies to every enemy it faces
+MOD_POG: int = 1
+MOD_OOD: int = 2
+MOD_SNEK: int = 4
+MOD_MEDUSA: int = 8
+
 # TODO: validate vectid elixir
 # TODO: Ozzy: move @property code to on_death() to speed things up?
 # TODO: Borge: move @property code as well?
@@ -149,6 +154,13 @@ class Hunter:
         self.inscryptions = {k: self.costs["inscryptions"][k]["max"] if v == "max" else v for k, v in config_dict["inscryptions"].items()}
         self.relics = config_dict["relics"]
         self.gems = config_dict["gems"]
+        # checked on every enemy spawn, so folded into flags once. Effects without points in them do nothing anyway.
+        self._mods_mask: int = (
+            (MOD_POG if self.talents.get("presence_of_god") else 0)
+            | (MOD_OOD if self.talents.get("omen_of_defeat") else 0)
+            | (MOD_SNEK if self.attributes.get("soul_of_snek") else 0)
+            | (MOD_MEDUSA if self.attributes.get("gift_of_medusa") else 0)
+        )
 
     def validate_config(self, cfg: Dict) -> bool:
         """Validate a build config dict against a perfect dummy build to see if they have identical keys in themselves and all value entries.
@@ -199,9 +211,10 @@ class Hunter:
         Args:
             damage (float): The amount of damage to receive.
         """
-        if random.random() < self.evade_chance:
+        if rand() < self.evade_chance:
             self.total_evades += 1
-            logging.debug(f'[{self.name:>{hunter_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tEVADE')
+            if debug_enabled(logging.DEBUG):
+                logging.debug(f'[{self.name:>{hunter_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tEVADE')
             return 0
         else:
             mitigated_damage = damage * (1 - self.damage_reduction)
@@ -209,7 +222,8 @@ class Hunter:
             self.total_taken += mitigated_damage
             self.total_mitigated += (damage - mitigated_damage)
             self.total_attacks_suffered += 1
-            logging.debug(f"[{self.name:>{hunter_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tTAKE\t{mitigated_damage:>6.2f}, {self.hp:.2f} HP left")
+            if debug_enabled(logging.DEBUG):
+                logging.debug(f"[{self.name:>{hunter_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tTAKE\t{mitigated_damage:>6.2f}, {self.hp:.2f} HP left")
             if self.is_dead():
                 self.on_death()
             return mitigated_damage
@@ -219,20 +233,21 @@ class Hunter:
 
         Args:
             value (float): The amount of hp to heal.
-            source (str): The source of the healing. Valid: regen, lifesteal, life_of_the_hunt
+            source (str): The source of the healing, as it appears in the log. Valid: REGEN, STEAL, LOTH, POTION
         """
-        effective_heal = min(value, self.missing_hp)
-        overhealing = value - effective_heal
+        missing_hp = self.missing_hp
+        effective_heal = value if value < missing_hp else missing_hp
         self.hp += effective_heal
-        logging.debug(f'[{self.name:>{hunter_name_spacing}}][@{self.sim.elapsed_time:>5}]:\t{source.upper().replace("_", " ")}\t{effective_heal:>6.2f} (+{overhealing:>6.2f} OVERHEAL)')
-        match source.lower():
-            case 'regen':
+        if debug_enabled(logging.DEBUG):
+            logging.debug(f'[{self.name:>{hunter_name_spacing}}][@{self.sim.elapsed_time:>5}]:\t{source}\t{effective_heal:>6.2f} (+{value - effective_heal:>6.2f} OVERHEAL)')
+        match source:
+            case 'REGEN':
                 self.total_regen += effective_heal
-            case 'steal':
+            case 'STEAL':
                 self.total_lifesteal += effective_heal
-            case 'loth':
+            case 'LOTH':
                 self.total_loth += effective_heal
-            case 'potion':
+            case 'POTION':
                 self.total_potion += effective_heal
             case _:
                 raise ValueError(f'Unknown heal source: {source}')
@@ -241,7 +256,7 @@ class Hunter:
         """Actions to take when the hunter kills an enemy. The Hunter() implementation only handles loot.
         """
         loot = self.compute_loot()
-        if (self.current_stage % 100 != 0 and self.current_stage > 0) and random.random() < self.effect_chance and (LL := self.talents["call_me_lucky_loot"]):
+        if (self.current_stage % 100 != 0 and self.current_stage > 0) and (LL := self.talents["call_me_lucky_loot"]) and rand() < self.effect_chance:
             # Talent: Call Me Lucky Loot, cannot proc on bosses
             loot *= 1 + (self.talents["call_me_lucky_loot"] * 0.2)
             self.total_effect_procs += 1
@@ -291,9 +306,11 @@ class Hunter:
             self.hp = self.max_hp * 0.8
             self.revive_log.append(self.current_stage)
             self.times_revived += 1
-            logging.debug(f'[{self.name:>{hunter_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tREVIVED, {self.talents["death_is_my_companion"] - self.times_revived} left')
+            if debug_enabled(logging.DEBUG):
+                logging.debug(f'[{self.name:>{hunter_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tREVIVED, {self.talents["death_is_my_companion"] - self.times_revived} left')
         else:
-            logging.debug(f'[{self.name:>{hunter_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tDIED\n')
+            if debug_enabled(logging.DEBUG):
+                logging.debug(f'[{self.name:>{hunter_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tDIED\n')
 
 
     ### UTILITY
@@ -688,19 +705,22 @@ class Borge(Hunter):
         Args:
             target (_type_): The enemy to attack.
         """
-        if random.random() < self.special_chance:
+        if rand() < self.special_chance:
             damage = self.power * self.special_damage
             self.total_crits += 1
             self.total_extra_from_crits += (damage - self.power)
-            logging.debug(f"[{self.name:>{hunter_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tATTACK\t{damage:>6.2f} (crit)")
+            if debug_enabled(logging.DEBUG):
+                logging.debug(f"[{self.name:>{hunter_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tATTACK\t{damage:>6.2f} (crit)")
         else:
             damage = self.power
-            logging.debug(f"[{self.name:>{hunter_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tATTACK\t{damage:>6.2f}")
+            if debug_enabled(logging.DEBUG):
+                logging.debug(f"[{self.name:>{hunter_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tATTACK\t{damage:>6.2f}")
         if self.mods["trample"] and not target.is_boss() and damage > target.max_hp:
             # Mod: Trample
             trample_kills = self.apply_trample(damage, current_target=target)
             if trample_kills > 1:
-                logging.debug(f"[{self.name:>{hunter_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tTRAMPLE {trample_kills} enemies")
+                if debug_enabled(logging.DEBUG):
+                    logging.debug(f"[{self.name:>{hunter_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tTRAMPLE {trample_kills} enemies")
                 self.trample_kills += trample_kills
             else:
                 super(Borge, self).attack(target, damage)
@@ -710,18 +730,18 @@ class Borge(Hunter):
         self.total_attacks += 1
 
         #  on_attack() effects
-        self.heal_hp(damage * self.lifesteal, 'steal')
-        if random.random() < self.effect_chance and (LotH := self.talents["life_of_the_hunt"]):
+        self.heal_hp(damage * self.lifesteal, 'STEAL')
+        if (LotH := self.talents["life_of_the_hunt"]) and rand() < self.effect_chance:
             # Talent: Life of the Hunt
             LotH_healing = damage * LotH * 0.06
-            self.heal_hp(LotH_healing, "loth")
+            self.heal_hp(LotH_healing, 'LOTH')
             self.total_loth += LotH_healing
             self.total_effect_procs += 1
-        if random.random() < self.effect_chance and self.talents["impeccable_impacts"]:
+        if self.talents["impeccable_impacts"] and rand() < self.effect_chance:
             # Talent: Impeccable Impacts, will call Hunter.apply_stun()
-            hpush(self.sim.queue, (0, 0, 'stun'))
+            self.sim.queue_action(0, 0, 'stun')
             self.total_effect_procs += 1
-        if random.random() < self.effect_chance and self.talents["fires_of_war"]:
+        if self.talents["fires_of_war"] and rand() < self.effect_chance:
             # Talent: Fires of War
             self.apply_fow()
             self.total_effect_procs += 1
@@ -751,17 +771,17 @@ class Borge(Hunter):
         inhaler_contrib = ((self.attributes["lifedrain_inhalers"] * 0.0008) * self.missing_hp)
         regen_value = self.regen + inhaler_contrib
         self.total_inhaler += inhaler_contrib
-        self.heal_hp(regen_value, 'regen')
+        self.heal_hp(regen_value, 'REGEN')
 
     ### SPECIALS
     def on_kill(self) -> None:
         """Actions to take when the hunter kills an enemy. Loot is handled by the parent class.
         """
         super(Borge, self).on_kill()
-        if random.random() < self.effect_chance and (ua := self.talents["unfair_advantage"]):
+        if (ua := self.talents["unfair_advantage"]) and rand() < self.effect_chance:
             # Talent: Unfair Advantage
             potion_healing = self.max_hp * (ua * 0.02)
-            self.heal_hp(potion_healing, "potion")
+            self.heal_hp(potion_healing, 'POTION')
             self.total_potion += potion_healing
             self.total_effect_procs += 1
 
@@ -800,7 +820,8 @@ class Borge(Hunter):
         """Apply the temporaryFires of War effect to Borge.
         """
         self.fires_of_war = self.talents["fires_of_war"] * 0.1
-        logging.debug(f'[{self.name:>{hunter_name_spacing}}][@{self.sim.elapsed_time:>5}]:\t[FoW]\t{self.fires_of_war:>6.2f} sec')
+        if debug_enabled(logging.DEBUG):
+            logging.debug(f'[{self.name:>{hunter_name_spacing}}][@{self.sim.elapsed_time:>5}]:\t[FoW]\t{self.fires_of_war:>6.2f} sec')
 
     def apply_trample(self, damage: float, current_target) -> int:
         """Apply the Trample effect to a number of enemies.
@@ -1215,23 +1236,24 @@ class Ozzy(Hunter):
         """
         # method handles all attacks: normal and triggered
         if not self.attack_queue: # normal attacks
-            if random.random() < (self.effect_chance / 2) and self.talents["tricksters_boon"]:
+            if self.talents["tricksters_boon"] and rand() < (self.effect_chance / 2):
                 # Talent: Trickster's Boon
                 self.trickster_charges += 1
                 self.total_effect_procs += 1
-                logging.debug(f"[{self.name:>{hunter_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tTRICKSTER")
-            if random.random() < self.special_chance:
+                if debug_enabled(logging.DEBUG):
+                    logging.debug(f"[{self.name:>{hunter_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tTRICKSTER")
+            if rand() < self.special_chance:
                 # Stat: Multi-Strike
                 self.attack_queue.append('(MS)')
-                hpush(self.sim.queue, (0, 1, 'hunter_special'))
-            if random.random() < self.effect_chance and self.talents["thousand_needles"]:
+                self.sim.queue_action(0, 1, 'hunter_special')
+            if self.talents["thousand_needles"] and rand() < self.effect_chance:
                 # Talent: Thousand Needles, will call Hunter.apply_stun(). Only Ozzy's main attack can stun.
-                hpush(self.sim.queue, (0, 0, 'stun'))
+                self.sim.queue_action(0, 0, 'stun')
                 self.total_effect_procs += 1
-            if random.random() < (self.effect_chance / 2) and self.talents["echo_bullets"]:
+            if self.talents["echo_bullets"] and rand() < (self.effect_chance / 2):
                 # Talent: Echo Bullets
                 self.attack_queue.append('(ECHO)')
-                hpush(self.sim.queue, (0, 2, 'hunter_special'))
+                self.sim.queue_action(0, 2, 'hunter_special')
             damage = self.power
             self.total_attacks += 1
             atk_type = ''
@@ -1243,10 +1265,10 @@ class Ozzy(Hunter):
                     self.total_ms_extra_damage += damage
                     self.total_multistrikes += 1
                 case '(ECHO)':
-                    if random.random() < self.special_chance:
+                    if rand() < self.special_chance:
                         # Stat: Multi-Strike
                         self.attack_queue.append('(ECHO-MS)')
-                        hpush(self.sim.queue, (0, 3, 'hunter_special'))
+                        self.sim.queue_action(0, 3, 'hunter_special')
                     damage = self.power * (self.talents["echo_bullets"] * 0.05)
                     self.total_echo += 1
                 case '(ECHO-MS)':
@@ -1262,7 +1284,8 @@ class Ozzy(Hunter):
         # crippling shots
         cripple_damage = omen_final * (1 + (self.crippling_on_target * 0.03))
         self.crippling_on_target = 0
-        logging.debug(f"[{self.name:>{hunter_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tATTACK\t{cripple_damage:>6.2f} {atk_type} OMEN: {omen_damage:>6.2f}")
+        if debug_enabled(logging.DEBUG):
+            logging.debug(f"[{self.name:>{hunter_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tATTACK\t{cripple_damage:>6.2f} {atk_type} OMEN: {omen_damage:>6.2f}")
         super(Ozzy, self).attack(target, cripple_damage)
         self.total_decay_damage += omen_damage
         self.total_cripple_extra_damage += (cripple_damage - omen_final)
@@ -1271,11 +1294,12 @@ class Ozzy(Hunter):
 
         # on_attack() effects
         # crippling shots and omen of decay inflict _extra damage_ that does not count towards lifesteal
-        self.heal_hp(damage * self.lifesteal, 'steal')
-        if random.random() < self.effect_chance and (cs := self.talents["crippling_shots"]):
+        self.heal_hp(damage * self.lifesteal, 'STEAL')
+        if (cs := self.talents["crippling_shots"]) and rand() < self.effect_chance:
             # Talent: Crippling Shots, can proc on any attack
             self.crippling_on_target += cs
-            logging.debug(f"[{self.name:>{hunter_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tCRIPPLE\t+{cs}")
+            if debug_enabled(logging.DEBUG):
+                logging.debug(f"[{self.name:>{hunter_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tCRIPPLE\t+{cs}")
             self.total_effect_procs += 1
         if target.is_dead():
             self.on_kill()
@@ -1291,11 +1315,12 @@ class Ozzy(Hunter):
         if self.trickster_charges:
             self.trickster_charges -= 1
             self.total_trickster_evades += 1
-            logging.debug(f'[{self.name:>{hunter_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tEVADE (TRICKSTER)')
+            if debug_enabled(logging.DEBUG):
+                logging.debug(f'[{self.name:>{hunter_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tEVADE (TRICKSTER)')
         else:
             _ = super(Ozzy, self).receive_damage(damage)
             if is_crit:
-                if (dod := self.attributes["dance_of_dashes"]) and random.random() < dod * 0.15:
+                if (dod := self.attributes["dance_of_dashes"]) and rand() < dod * 0.15:
                     # Talent: Dance of Dashes
                     self.trickster_charges += 1
                     self.total_effect_procs += 1
@@ -1307,17 +1332,17 @@ class Ozzy(Hunter):
         if self.empowered_regen > 0:
             regen_value *= 1 + (self.attributes["vectid_elixir"] * 0.15)
             self.empowered_regen -= 1
-        self.heal_hp(regen_value, 'regen')
+        self.heal_hp(regen_value, 'REGEN')
 
     ### SPECIALS
     def on_kill(self) -> None:
         """Actions to take when the hunter kills an enemy. Loot is handled by the parent class.
         """
         super(Ozzy, self).on_kill()
-        if random.random() < self.effect_chance and (ua := self.talents["unfair_advantage"]):
+        if (ua := self.talents["unfair_advantage"]) and rand() < self.effect_chance:
             # Talent: Unfair Advantage
             potion_healing = self.max_hp * (ua * 0.02)
-            self.heal_hp(potion_healing, "potion")
+            self.heal_hp(potion_healing, 'POTION')
             self.total_potion += potion_healing
             self.total_effect_procs += 1
             # Attribute: Vectid Elixir
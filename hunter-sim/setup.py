@@ -5,6 +5,7 @@ setup(
     version='0.1',
     packages=find_packages(),
     install_requires=[
+        'numpy',
         'pyyaml',
     ],
     entry_points={
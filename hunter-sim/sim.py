@@ -10,10 +10,12 @@ from math import floor
 from string import capwords
 from typing import Dict, Generator, List, Tuple
 
+import numpy as np
 import rich
 from hunters import Borge, Hunter, Ozzy, hunter_name_spacing
 from tqdm import tqdm
-from units import Boss, Enemy
+from units import Boss, Enemy, EnemyBatch
+from util.aliases import debug_enabled
 
 
 def sim_worker(hunter_class: Hunter, config_dict: Dict) -> None:
@@ -351,7 +353,8 @@ class Simulation():
         self.hunter.sim = self
         self.enemies: List[Enemy] = None
         self.current_stage = -1
-        self.queue: List[tuple] = []
+        self.queue: List[list] = []
+        self.entry_finder: Dict[str, list] = {}
         self.elapsed_time: int = 0
 
     def complete_stage(self) -> None:
@@ -360,6 +363,33 @@ class Simulation():
         self.current_stage += 1
         self.hunter.complete_stage()
 
+    def queue_action(self, time: float, priority: int, action: str) -> None:
+        """Push an action onto the simulation queue. The entry is remembered by its action name so that it can be
+        rescheduled or cancelled later without searching the queue.
+
+        Args:
+            time (float): Time at which the action is triggered.
+            priority (int): Tie-breaker for actions triggered at the same time, lower goes first.
+            action (str): Name of the action.
+        """
+        entry = [time, priority, action, True]
+        self.entry_finder[action] = entry
+        hpush(self.queue, entry)
+
+    def cancel_action(self, action: str) -> list:
+        """Invalidate the most recently queued entry of an action. Invalid entries stay in the queue and are skipped once
+        they are popped.
+
+        Args:
+            action (str): Name of the action.
+
+        Returns:
+            list: The cancelled queue entry.
+        """
+        entry = self.entry_finder.pop(action)
+        entry[3] = False
+        return entry
+
     def spawn_enemies(self, hunter) -> None:
         """Spawn enemies for the current stage.
 
@@ -398,43 +428,61 @@ class Simulation():
         self.current_stage = 0
         self.elapsed_time = 0
         self.queue = []
-        hpush(self.queue, (round(hunter.speed, 3), 1, 'hunter'))
-        hpush(self.queue, (self.elapsed_time, 3, 'regen'))
+        self.entry_finder = {}
+        self.queue_action(round(hunter.speed, 3), 1, 'hunter')
+        self.queue_action(self.elapsed_time, 3, 'regen')
+        # the queue is only ever mutated in place from here on, so the scheduler loop can work on a local reference
+        queue = self.queue
+        log_queue = debug_enabled(logging.DEBUG)
         while not hunter.is_dead():
-            logging.debug('')
-            logging.debug(f'Entering STAGE {self.current_stage}')
+            if debug_enabled(logging.DEBUG):
+                logging.debug('')
+                logging.debug(f'Entering STAGE {self.current_stage}')
             self.spawn_enemies(hunter)
             while self.enemies:
-                logging.debug('')
-                logging.debug(hunter)
+                if debug_enabled(logging.DEBUG):
+                    logging.debug('')
+                    logging.debug(hunter)
                 enemy = self.enemies.pop(0)
-                logging.debug(enemy)
+                if debug_enabled(logging.DEBUG):
+                    logging.debug(enemy)
                 enemy.queue_initial_attack()
-                # combat loop
-                while not enemy.is_dead() and not hunter.is_dead():
-                    logging.debug(f'[  QUEUE]:           {self.queue}')
-                    prev_time, _, action = hpop(self.queue)
+                # combat loop, checking hp directly rather than calling is_dead() on both units for every event
+                while enemy.hp > 0 and hunter.hp > 0:
+                    entry = hpop(queue)
+                    prev_time, _, action, valid = entry
+                    if not valid:
+                        continue
+                    if log_queue:
+                        # the popped entry goes first, as it was at the head of the queue. Cancelled entries are left out.
+                        logging.debug(f'[  QUEUE]:           {[entry] + [e for e in queue if e[3]]}')
+                    # recurring actions are rescheduled by pushing their popped entry back with an updated time, which
+                    # keeps it registered in the entry finder and avoids allocating a new entry for every event
                     match action:
                         case 'hunter':
                             hunter.attack(enemy)
-                            hpush(self.queue, (round(prev_time + hunter.speed, 3), 1, 'hunter'))
+                            entry[0] = round(prev_time + hunter.speed, 3)
+                            hpush(queue, entry)
                         case 'enemy':
                             enemy.attack(hunter)
-                            if not enemy.is_dead():
-                                hpush(self.queue, (round(prev_time + enemy.speed, 3), 2, 'enemy'))
+                            if enemy.hp > 0:
+                                entry[0] = round(prev_time + enemy.speed, 3)
+                                hpush(queue, entry)
                         case 'stun':
                             hunter.apply_stun(enemy, isinstance(enemy, Boss))
                         case 'hunter_special':
                             hunter.attack(enemy)
                         case 'enemy_special':
                             enemy.attack_special(hunter)
-                            if not enemy.is_dead():
-                                hpush(self.queue, (round(prev_time + enemy.speed2, 3), 2, 'enemy_special'))
+                            if enemy.hp > 0:
+                                entry[0] = round(prev_time + enemy.speed2, 3)
+                                hpush(queue, entry)
                         case 'regen':
                             hunter.regen_hp()
                             enemy.regen_hp()
                             self.elapsed_time += 1
-                            hpush(self.queue, (self.elapsed_time, 3, 'regen'))
+                            entry[0] = self.elapsed_time
+                            hpush(queue, entry)
                         case _:
                             raise ValueError(f'Unknown action: {action}')
                 if hunter.is_dead():
@@ -443,6 +491,100 @@ class Simulation():
         raise ValueError('Hunter is dead, no return triggered')
 
 
+class BatchSimulation():
+    """Vectorised Monte-Carlo simulation of many independent fights between a hunter and a single enemy of one stage.
+
+    Every trajectory follows the same event order as `Simulation` (hunter attack, enemy attack, regen tick), but only the
+    core stats of both sides take part: the hunter's talent and attribute procs, revives and bosses are not modelled and
+    Ozzy's multistrikes are folded into the attack that triggered them. Meant for cheap variance estimates of a single
+    stage, not as a replacement for full simulation runs.
+    """
+    def __init__(self, hunter: Hunter, stage: int, size: int, seed: int = None) -> None:
+        """Creates a BatchSimulation instance.
+
+        Args:
+            hunter (Hunter): Hunter instance. Modified in place: if it is still on an earlier stage, it is advanced to
+                `stage` with `Hunter.complete_stage()`, so pass a fresh instance to keep the original untouched.
+            stage (int): Stage of the simulated enemies. Must not be a boss stage.
+            size (int): Number of trajectories to simulate.
+            seed (int, optional): Seed for the random number generator. Defaults to None.
+
+        Raises:
+            ValueError: If the stage is a boss stage.
+        """
+        if stage % 100 == 0 and stage > 0:
+            raise ValueError(f'Bosses are not supported in batch simulations: {stage}')
+        if hunter.current_stage < stage:
+            hunter.complete_stage(stage - hunter.current_stage)
+        self.hunter: Hunter = hunter
+        self.stage: int = stage
+        self.size: int = size
+        self.rng: np.random.Generator = np.random.default_rng(seed)
+        self.enemies: EnemyBatch = EnemyBatch(hunter, stage, size)
+
+    def hunter_attack_batch(self, mask: np.ndarray) -> np.ndarray:
+        """Compute the damage of the hunter's attacks in all trajectories selected by `mask`.
+
+        Args:
+            mask (np.ndarray): Boolean array of the trajectories in which the hunter attacks.
+
+        Returns:
+            np.ndarray: Damage of each attack, 0 for trajectories in which the hunter does not attack.
+        """
+        h = self.hunter
+        is_special = self.rng.random(self.size) < h.special_chance
+        if isinstance(h, Borge):
+            # Stat: Crit
+            damage = np.where(is_special, h.power * h.special_damage, h.power)
+        else:
+            # Stat: Multi-Strike
+            damage = h.power + np.where(is_special, h.power * h.special_damage, 0)
+        return damage * mask
+
+    def run(self) -> Dict:
+        """Simulate all trajectories until either the hunter or the enemy is dead.
+
+        Returns:
+            Dict: Arrays of `fight_time`, the time of the last event of each fight in seconds (unlike the whole number
+                of regen ticks that `Simulation.run()` reports as `elapsed_time`), `enemy_killed`, whether the enemy
+                was killed, and `hunter_hp`, the hunter's hp left.
+        """
+        h, e, rng, n = self.hunter, self.enemies, self.rng, self.size
+        hp = np.full(n, float(h.hp))
+        # time of the next hunter attack, enemy attack and regen tick. Rows are ordered like their queue priority, so
+        # argmin resolves ties the same way as the simulation queue does.
+        next_action = np.stack([np.full(n, round(h.speed, 3)), np.round(e.speed, 3), np.zeros(n)])
+        fight_time = np.zeros(n)
+        active = np.ones(n, dtype=bool)
+        while active.any():
+            action = next_action.argmin(axis=0)
+            now = next_action.min(axis=0)
+            fight_time[active] = now[active]
+
+            # hunter attacks, lifesteal heals the hunter
+            turn = active & (action == 0)
+            damage = self.hunter_attack_batch(turn)
+            e.receive_damage_batch(damage, rng, turn)
+            np.add(hp, np.minimum(damage * h.lifesteal, h.max_hp - hp), out=hp, where=turn)
+            next_action[0] = np.where(turn, np.round(now + h.speed, 3), next_action[0])
+
+            # enemy attacks
+            turn = active & (action == 1)
+            damage, _ = e.attack_batch(rng, turn)
+            hit = turn & (rng.random(n) >= h.evade_chance)
+            np.subtract(hp, damage * (1 - h.damage_reduction), out=hp, where=hit)
+            next_action[1] = np.where(turn, np.round(now + e.speed, 3), next_action[1])
+
+            # regen ticks
+            turn = active & (action == 2)
+            np.add(hp, np.minimum(h.regen, h.max_hp - hp), out=hp, where=turn)
+            e.regen_batch(turn)
+            next_action[2] += turn
+
+            active &= ~e.dead & (hp > 0)
+        return {'fight_time': fight_time, 'enemy_killed': e.dead.copy(), 'hunter_hp': hp}
+
+
 def main():
     logging.basicConfig(
         filename='./logs/ozzy_test.txt',
@@ -1,15 +1,175 @@
 import logging
-import random
-from heapq import heapify
-from heapq import heappush as hpush
+from typing import Tuple
 
-from hunters import Borge, Hunter, Ozzy
+import numpy as np
+from hunters import MOD_MEDUSA, MOD_OOD, MOD_POG, MOD_SNEK, Borge, Hunter, Ozzy
+from util.aliases import debug_enabled, rand
 
 unit_name_spacing: int = 7
 
 # TODO: Verify whether Gothmogor's secondary attack contributes to enrage stacks
 
+# enemy stats only depend on the hunter type and the stage, so they are computed once for every stage at import time
+MAX_STAGE: int = 300
+_STAT_KEYS = ('hp', 'power', 'regen', 'special_chance', 'special_damage', 'damage_reduction', 'evade_chance', 'speed')
+
+
+def _borge_stat_table() -> np.ndarray:
+    """Computes the stats of Borge's enemies for every stage below `MAX_STAGE`.
+
+    Returns:
+        np.ndarray: Array of shape `(MAX_STAGE, len(_STAT_KEYS))`, one row of stats per stage.
+    """
+    stage = np.arange(MAX_STAGE)
+    late_scaling = np.where(stage >= 150, 1 + ((stage-149) * (0.006 + 0.006 * (stage-150) // 50)), 1)
+    return np.stack([
+        # hp
+        (
+            (9 + (stage * 4))
+            * np.where(stage > 100, 2.85, 1)
+            * np.where(stage >= 150, 1 + ((stage // 150) * (stage-149) * (0.006 + 0.006 * (stage-150) // 50)), 1)
+        ),
+        # power
+        (2.5 + (stage * 0.7)) * np.where(stage > 100, 2.85, 1) * late_scaling,
+        # regen
+        np.where(stage > 1, 0.00 + ((stage - 1) * 0.08), 0) * np.where(stage > 100, 1.052, 1) * late_scaling,
+        # special_chance, special_damage. patch 2024-01-24: enemies cant exceed 25% crit chance and 250% crit damage
+        np.minimum(0.0322 + (stage * 0.0004), 0.25),
+        np.minimum(1.21 + (stage * 0.008025), 2.5),
+        # damage_reduction
+        np.zeros(MAX_STAGE),
+        # evade_chance
+        np.where(stage > 100, 0.004, 0),
+        # speed
+        4.53 - (stage * 0.006),
+    ], axis=1)
+
+
+def _ozzy_stat_table() -> np.ndarray:
+    """Computes the stats of Ozzy's enemies for every stage below `MAX_STAGE`.
+
+    Returns:
+        np.ndarray: Array of shape `(MAX_STAGE, len(_STAT_KEYS))`, one row of stats per stage.
+    """
+    stage = np.arange(MAX_STAGE)
+    late_scaling = np.where(stage >= 150, 1 + ((stage-149) * (0.006 + 0.006 * (stage-150) // 50)), 1)
+    return np.stack([
+        # hp
+        (
+            (11 + (stage * 6))
+            * np.where(stage > 100, 2.9, 1)
+            * np.where(stage >= 150, 1 + ((stage // 150) * (stage-149) * (0.006 + 0.006 * (stage-150) // 50)), 1)
+        ),
+        # power
+        (1.35 + (stage * 0.75)) * np.where(stage > 100, 2.7, 1) * late_scaling,
+        # regen
+        np.where(stage > 0, 0.02 + ((stage-1) * 0.1), 0) * np.where(stage > 100, 1.25, 1) * late_scaling,
+        # special_chance, special_damage. patch 2024-01-24: enemies cant exceed 25% crit chance and 250% crit damage
+        np.minimum(0.0994 + (stage * 0.0006), 0.25),
+        np.minimum(1.03 + (stage * 0.008), 2.5),
+        # damage_reduction
+        np.zeros(MAX_STAGE),
+        # evade_chance
+        np.where(stage > 100, 0.01, 0),
+        # speed
+        3.20 - (stage * 0.004),
+    ], axis=1)
+
+
+_BORGE_STATS = _borge_stat_table()
+_OZZY_STATS = _ozzy_stat_table()
+# looked up by exact hunter type, which is cheaper than walking the MRO with isinstance()
+_STAT_TABLES = {Borge: _BORGE_STATS, Ozzy: _OZZY_STATS}
+# the same stats as plain dicts for `Enemy.fetch_stats()`, so spawning an enemy does not have to convert a table row
+_STAT_ROWS = {hunter: [dict(zip(_STAT_KEYS, row)) for row in table.tolist()] for hunter, table in _STAT_TABLES.items()}
+
+
+# boss stats are fixed per hunter type and stage, keyed by the stage the boss appears on
+_BORGE_BOSS_STATS = {
+    100: {
+        'hp': 36810,
+        'power': 263.18,
+        'regen': 15.21,
+        'special_chance': 0.1122,
+        'special_damage': 2.26,
+        'damage_reduction': 0.05,
+        'evade_chance': 0.004,
+        'speed': 9.50,
+        'enrage_effect': 0.0475,
+        'enrage_effect2': 0,
+    },
+    200: {
+        'hp': 272250,
+        'power': 1930,
+        'regen': 42.19,
+        'special_chance': 0.1522,
+        'special_damage': 2.50,
+        'damage_reduction': 0.09,
+        'evade_chance': 0.004,
+        'speed': 8.05,
+        'speed2': 14.49,
+        'special': 'gothmorgor',
+        'enrage_effect': 0.04,
+        'enrage_effect2': 0.0725,
+    },
+}
+_OZZY_BOSS_STATS = {
+    100: {
+        'hp': 29328,
+        'power': 229.05,
+        'regen': 59.52,
+        'special_chance': 0.25, # 0.3094 before the 2024-01-24 crit cap
+        'special_damage': 1.83,
+        'damage_reduction': 0.05,
+        'evade_chance': 0.01,
+        'speed': 6.87,
+        'enrage_effect': 0.033658536585365856,
+        'enrage_effect2': 0,
+    },
+    200: {
+        'hp': 221170,
+        'power': 1610,
+        'regen': 196.01,
+        'special_chance': 0.25,
+        'special_damage': 2.50,
+        'damage_reduction': 0.09,
+        'evade_chance': 0.01,
+        'speed': 5.89,
+        'speed2': 25.4,
+        'special': 'exoscarab',
+        'enrage_effect': 0.029,
+        'enrage_effect2': 0,
+    },
+}
+_BOSS_STATS = {Borge: _BORGE_BOSS_STATS, Ozzy: _OZZY_BOSS_STATS}
+
+
+def _enemy_stats(hunter: Hunter, stage: int) -> np.ndarray:
+    """Looks up the row of enemy stats for a hunter type and stage.
+
+    Args:
+        hunter (Hunter): The hunter that the enemy will be fighting, for enemy type selection.
+        stage (int): The stage of the enemy, for stat selection.
+
+    Raises:
+        ValueError: If the hunter is not a valid hunter.
+        ValueError: If the stage is outside of the precomputed stat tables.
+
+    Returns:
+        np.ndarray: The stats of the enemy, ordered like `_STAT_KEYS`.
+    """
+    if (table := _STAT_TABLES.get(type(hunter))) is None:
+        raise ValueError(f'Unknown hunter: {hunter}')
+    if not 0 <= stage < MAX_STAGE:
+        raise ValueError(f'Invalid stage for enemy creation: {stage}')
+    return table[stage]
+
 class Enemy:
+    __slots__ = (
+        'name', 'hp', 'max_hp', 'power', 'regen', 'damage_reduction', 'evade_chance', 'special_chance', 'special_damage',
+        'speed', 'has_special', 'stun_duration', 'missing_hp', 'sim',
+    )
+
     ### CREATION
     def __init__(self, name: str, hunter: Hunter, stage: int, sim) -> None:
         """Creates an Enemy instance.
@@ -23,9 +183,11 @@ class Enemy:
         self.__create__(name=name, **self.fetch_stats(hunter, stage))
         self.sim = sim
         self.on_create(hunter)
+        # on creation effects can lower hp (Presence of God)
+        self.missing_hp = self.max_hp - self.hp
 
     def fetch_stats(self, hunter: Hunter, stage: int) -> dict:
-        """Fetches the stats of the enemy.
+        """Fetches the stats of the enemy from the precomputed stat tables.
 
         Args:
             hunter (Hunter): The hunter that this enemy will be fighting, for enemy type selection.
@@ -33,64 +195,16 @@ class Enemy:
 
         Raises:
             ValueError: If the hunter is not a valid hunter.
+            ValueError: If the stage is outside of the precomputed stat tables.
 
         Returns:
-            dict: The stats of the enemy.
+            dict: The stats of the enemy. Shared between all enemies of the same type and stage, so it must not be modified.
         """
-        if isinstance(hunter, Borge):
-            return {
-                'hp': (
-                    (9 + (stage * 4))
-                    * (2.85 if stage > 100 else 1)
-                    * (1 + ((stage // 150) * (stage-149) * (0.006 + 0.006 * (stage-150) // 50)) if stage >= 150 else 1)
-                ),
-                'power': (
-                    (2.5 + (stage * 0.7))
-                    * (2.85 if stage > 100 else 1)
-                    * (1 + ((stage-149) * (0.006 + 0.006 * (stage-150) // 50)) if stage >= 150 else 1)
-                ),
-                'regen': (
-                    (0.00 + ((stage - 1) * 0.08) if stage > 1 else 0)
-                    * (1.052 if stage > 100 else 1)
-                    * (1 + ((stage-149) * (0.006 + 0.006 * (stage-150) // 50)) if stage >= 150 else 1)
-                ),
-                'special_chance': (0.0322 + (stage * 0.0004)),
-                'special_damage': (1.21 + (stage * 0.008025)),
-                'damage_reduction': (0),
-                'evade_chance': (
-                    0
-                    + (0.004 if stage > 100 else 0)
-                ),
-                'speed':(4.53 - (stage * 0.006)),
-            }
-        elif isinstance(hunter, Ozzy):
-            return {
-                'hp': (
-                    (11 + (stage * 6))
-                    * (2.9 if stage > 100 else 1)
-                    * (1 + ((stage // 150) * (stage-149) * (0.006 + 0.006 * (stage-150) // 50)) if stage >= 150 else 1)
-                ),
-                'power': (
-                    (1.35 + (stage * 0.75))
-                    * (2.7 if stage > 100 else 1)
-                    * (1 + ((stage-149) * (0.006 + 0.006 * (stage-150) // 50)) if stage >= 150 else 1)
-                ),
-                'regen': (
-                    (0.02 + ((stage-1) * 0.1) if stage > 0 else 0)
-                    * (1.25 if stage > 100 else 1)
-                    * (1 + ((stage-149) * (0.006 + 0.006 * (stage-150) // 50)) if stage >= 150 else 1)
-                ),
-                'special_chance': 0.0994 + (stage * 0.0006),
-                'special_damage': 1.03 + (stage * 0.008),
-                'damage_reduction': 0,
-                'evade_chance': (
-                    0
-                    + (0.01 if stage > 100 else 0)
-                ),
-                'speed': 3.20 - (stage * 0.004),
-            }
-        else:
+        if (rows := _STAT_ROWS.get(type(hunter))) is None:
             raise ValueError(f'Unknown hunter: {hunter}')
+        if not 0 <= stage < MAX_STAGE:
+            raise ValueError(f'Invalid stage for enemy creation: {stage}')
+        return rows[stage]
 
     def __create__(self, name: str, hp: float, power: float, regen: float, damage_reduction: float, evade_chance: float, 
                  special_chance: float, special_damage: float, speed: float, **kwargs) -> None:
@@ -117,9 +231,9 @@ class Enemy:
         self.regen: float = regen
         self.damage_reduction: float = damage_reduction
         self.evade_chance: float = evade_chance
-        # patch 2024-01-24: enemies cant exceed 25% crit chance and 250% crit damage
-        self.special_chance: float = min(special_chance, 0.25)
-        self.special_damage: float = min(special_damage, 2.5)
+        # crit caps are already applied to the stat tables and boss stats
+        self.special_chance: float = special_chance
+        self.special_damage: float = special_damage
         self.speed: float = speed
         self.has_special = False
         if isinstance(self, Boss): # regular boss enrage effect
@@ -130,7 +244,7 @@ class Enemy:
             self.enrage_effect2 = kwargs['enrage_effect2']
             self.has_special: bool = True
         self.stun_duration: float = 0
-        self.missing_hp: float
+        self.missing_hp: float = 0.0
 
     def on_create(self, hunter: Hunter) -> None:
         """Executes on creation effects such as Presence of God, Omen of Defeat, and Soul of Snek.
@@ -138,22 +252,25 @@ class Enemy:
         Args:
             hunter (Hunter): The hunter that this enemy is fighting.
         """
-        if 'presence_of_god' in hunter.talents:
+        mods = hunter._mods_mask
+        if not mods:
+            return
+        if mods & MOD_POG:
             hunter.apply_pog(self)
-        if 'omen_of_defeat' in hunter.talents:
+        if mods & MOD_OOD:
             hunter.apply_ood(self)
-        if 'soul_of_snek' in hunter.attributes:
+        if mods & MOD_SNEK:
             hunter.apply_snek(self)
-        if 'gift_of_medusa' in hunter.attributes:
+        if mods & MOD_MEDUSA:
             hunter.apply_medusa(self)
 
     ### CONTENT
     def queue_initial_attack(self) -> None:
         """Queue the initial attacks of the enemy.
         """
-        hpush(self.sim.queue, (round(self.sim.elapsed_time + self.speed, 3), 2, 'enemy'))
+        self.sim.queue_action(round(self.sim.elapsed_time + self.speed, 3), 2, 'enemy')
         if self.has_special:
-            hpush(self.sim.queue, (round(self.sim.elapsed_time + self.speed2, 3), 2, 'enemy_special'))
+            self.sim.queue_action(round(self.sim.elapsed_time + self.speed2, 3), 2, 'enemy_special')
 
     def attack(self, hunter: Hunter) -> None:
         """Attack the hunter.
@@ -161,14 +278,14 @@ class Enemy:
         Args:
             hunter (Hunter): The hunter to attack.
         """
-        if random.random() < self.special_chance:
+        if rand() < self.special_chance:
             damage = self.power * self.special_damage
             is_crit = True
-            logging.debug(f"[{self.name:>{unit_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tATTACK\t{damage:>6.2f} (crit)")
         else:
             damage = self.power
             is_crit = False
-            logging.debug(f"[{self.name:>{unit_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tATTACK\t{damage:>6.2f}")
+        if debug_enabled(logging.DEBUG):
+            logging.debug(f"[{self.name:>{unit_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tATTACK\t{damage:>6.2f}{' (crit)' if is_crit else ''}")
         hunter.receive_damage(self, damage, is_crit)
 
     def receive_damage(self, damage: float, is_reflected: bool = False) -> None:
@@ -177,13 +294,16 @@ class Enemy:
         Args:
             damage (float): Damage to receive.
         """
-        if not is_reflected and random.random() < self.evade_chance:
-            logging.debug(f"[{self.name:>{unit_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tEVADE")
+        if not is_reflected and self.evade_chance and rand() < self.evade_chance:
+            if debug_enabled(logging.DEBUG):
+                logging.debug(f"[{self.name:>{unit_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tEVADE")
         else:
             mitigated_damage = damage * (1 - self.damage_reduction)
             self.hp -= mitigated_damage
-            logging.debug(f"[{self.name:>{unit_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tTAKE\t{mitigated_damage:>6.2f}, {self.hp:.2f} HP left")
-            if self.is_dead():
+            self.missing_hp = self.max_hp - self.hp
+            if debug_enabled(logging.DEBUG):
+                logging.debug(f"[{self.name:>{unit_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tTAKE\t{mitigated_damage:>6.2f}, {self.hp:.2f} HP left")
+            if self.hp <= 0:
                 if is_reflected:
                     self.sim.hunter.helltouch_kills += 1
                 self.on_death()
@@ -193,19 +313,30 @@ class Enemy:
 
         Args:
             value (float): The amount of hp to heal.
-            source (str): The source of the healing. Valid: regen, lifesteal, life_of_the_hunt
+            source (str): The source of the healing, as it appears in the log. Valid: REGEN
         """
-        effective_heal = min(value, self.missing_hp)
+        missing_hp = self.missing_hp
+        effective_heal = value if value < missing_hp else missing_hp
         self.hp += effective_heal
-        logging.debug(f"[{self.name:>{unit_name_spacing}}][@{self.sim.elapsed_time:>5}]:\t{source.upper().replace('_', ' ')}\t{effective_heal:>6.2f}")
+        self.missing_hp = self.max_hp - self.hp
+        if debug_enabled(logging.DEBUG):
+            logging.debug(f"[{self.name:>{unit_name_spacing}}][@{self.sim.elapsed_time:>5}]:\t{source}\t{effective_heal:>6.2f}")
 
     def regen_hp(self) -> None:
-        """Regenerates hp according to the regen stat.
+        """Regenerates hp according to the regen stat. Accounts for overhealing.
         """
+        # called on the enemy currently fighting on every regen tick, so this copies the overheal clamp of heal_hp() and
+        # the is_dead() check inline. Boss.regen_hp() still goes through both on purpose, as it is only run once per
+        # tick for a single boss per 100 stages and handles the Harden effect on top.
         regen_value = self.regen
-        self.heal_hp(regen_value, 'regen')
+        missing_hp = self.missing_hp
+        effective_heal = regen_value if regen_value < missing_hp else missing_hp
+        self.hp += effective_heal
+        self.missing_hp = self.max_hp - self.hp
+        if debug_enabled(logging.DEBUG):
+            logging.debug(f"[{self.name:>{unit_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tREGEN\t{effective_heal:>6.2f}")
         # handle death from Ozzy's Gift of Medusa
-        if self.is_dead():
+        if self.hp <= 0:
             self.sim.hunter.medusa_kills += 1
             self.on_death()
 
@@ -215,10 +346,10 @@ class Enemy:
         Args:
             duration (float): The duration of the stun.
         """
-        qe = [(p1, p2, u) for p1, p2, u in self.sim.queue if u == 'enemy'][0]
-        self.sim.queue.remove(qe)
-        hpush(self.sim.queue, (qe[0] + duration, qe[1], qe[2]))
-        logging.debug(f"[{self.name:>{unit_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tSTUNNED\t{duration:>6.2f} sec")
+        qe = self.sim.cancel_action('enemy')
+        self.sim.queue_action(qe[0] + duration, qe[1], 'enemy')
+        if debug_enabled(logging.DEBUG):
+            logging.debug(f"[{self.name:>{unit_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tSTUNNED\t{duration:>6.2f} sec")
 
     def is_boss(self) -> bool:
         """Check if the unit is a boss.
@@ -240,9 +371,11 @@ class Enemy:
         """Executes on death effects. For enemy units, that is mostly just removing them from the sim queue and incrementing hunter kills.
         """
         if not suppress_logging:
-            logging.debug(f"[{self.name:>{unit_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tDIED")
-        self.sim.queue = [(p1, p2, u) for p1, p2, u in self.sim.queue if u not in ['enemy', 'enemy_special']]
-        heapify(self.sim.queue)
+            if debug_enabled(logging.DEBUG):
+                logging.debug(f"[{self.name:>{unit_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tDIED")
+        for action in ('enemy', 'enemy_special'):
+            if action in self.sim.entry_finder:
+                self.sim.cancel_action(action)
         self.sim.hunter.total_kills += 1
         self.sim.hunter.on_kill()
 
@@ -252,19 +385,11 @@ class Enemy:
         Currently only used for Trample, which is a guaranteed kill.
         """
         self.hp = 0
+        self.missing_hp = self.max_hp
         self.on_death(suppress_logging=True)
 
     ### UTILITY
 
-    @property
-    def missing_hp(self) -> float:
-        """Calculates the missing hp of the unit.
-
-        Returns:
-            float: The missing hp of the unit.
-        """
-        return self.max_hp - self.hp
-
     def __str__(self) -> str:
         """Prints the stats of this Enemy's instance.
 
@@ -275,6 +400,11 @@ class Enemy:
 
 
 class Boss(Enemy):
+    __slots__ = (
+        'speed2', 'base_speed', 'base_speed2', 'secondary_attack', 'enrage_stacks', 'enrage_effect', 'enrage_effect2',
+        'max_enrage', 'harden_ticks_left', 'previous_dr', 'attack',
+    )
+
     ### CREATION
     def __init__(self, name: str, hunter: Hunter, stage: int, sim) -> None:
         """Creates a Boss instance.
@@ -289,6 +419,12 @@ class Boss(Enemy):
         self.enrage_stacks: int = 0
         self.harden_ticks_left: int = 0 # Exoscarab secondary attack mechanic
         self.max_enrage: bool = False
+        # swapped for _attack_post_enrage() once max enrage is reached, so later attacks skip the transition check
+        self.attack = self._attack_pre_enrage
+        # speeds only change with enrage stacks, so they are recomputed in apply_enrage() instead of on every access
+        self.base_speed: float = self.speed
+        if self.has_special:
+            self.base_speed2: float = self.speed2
 
     def fetch_stats(self, hunter: Hunter, stage: int) -> dict:
         """Fetches the stats of the boss.
@@ -299,89 +435,42 @@ class Boss(Enemy):
 
         Raises:
             ValueError: If the hunter is not a valid hunter.
+            ValueError: If there is no boss for the stage.
 
         Returns:
-            dict: The stats of the boss.
+            dict: The stats of the boss. Shared between all bosses of the same type, so it must not be modified.
         """
-        if isinstance(hunter, Borge):
-            if stage == 100:
-                return {
-                    'hp': 36810,
-                    'power': 263.18,
-                    'regen': 15.21,
-                    'special_chance': 0.1122,
-                    'special_damage': 2.26,
-                    'damage_reduction': 0.05,
-                    'evade_chance': 0.004,
-                    'speed': 9.50,
-                    'enrage_effect': 0.0475,
-                    'enrage_effect2': 0,
-                }
-            elif stage == 200:
-                return {
-                    'hp': 272250,
-                    'power': 1930,
-                    'regen': 42.19,
-                    'special_chance': 0.1522,
-                    'special_damage': 2.50,
-                    'damage_reduction': 0.09,
-                    'evade_chance': 0.004,
-                    'speed': 8.05,
-                    'speed2': 14.49,
-                    'special': 'gothmorgor',
-                    'enrage_effect': 0.04,
-                    'enrage_effect2': 0.0725,
-                }
-            else:
-                raise ValueError(f'Invalid stage for boss creation: {stage}')
-        elif isinstance(hunter, Ozzy):
-            if stage == 100:
-                return {
-                    'hp': 29328,
-                    'power': 229.05,
-                    'regen': 59.52,
-                    'special_chance': 0.3094,
-                    'special_damage': 1.83,
-                    'damage_reduction': 0.05,
-                    'evade_chance': 0.01,
-                    'speed': 6.87,
-                    'enrage_effect': 0.033658536585365856,
-                    'enrage_effect2': 0,
-                }
-            elif stage == 200:
-                return {
-                    'hp': 221170,
-                    'power': 1610,
-                    'regen': 196.01,
-                    'special_chance': 0.25,
-                    'special_damage': 2.50,
-                    'damage_reduction': 0.09,
-                    'evade_chance': 0.01,
-                    'speed': 5.89,
-                    'speed2': 25.4,
-                    'special': 'exoscarab',
-                    'enrage_effect': 0.029,
-                    'enrage_effect2': 0,
-                }
-            else:
-                raise ValueError(f'Invalid stage for boss creation: {stage}')
-        else:
+        if (stats := _BOSS_STATS.get(type(hunter))) is None:
             raise ValueError(f'Unknown hunter: {hunter}')
+        if stage not in stats:
+            raise ValueError(f'Invalid stage for boss creation: {stage}')
+        return stats[stage]
 
-    def attack(self, hunter: Hunter) -> None:
-        """Attack the hunter.
+    def _attack_pre_enrage(self, hunter: Hunter) -> None:
+        """Attack the hunter and check for the max enrage transition. Used as `Boss.attack()` until max enrage is reached.
 
         Args:
             hunter (Hunter): The hunter to attack.
         """
-        super(Boss, self).attack(hunter)
-        self.enrage_stacks += 1
-        logging.debug(f"[{self.name:>{unit_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tENRAGE\t{self.enrage_stacks:>6.2f} stacks")
-        if self.enrage_stacks >= 200 and not self.max_enrage:
+        self._attack_post_enrage(hunter)
+        if self.enrage_stacks >= 200:
             self.max_enrage = True
             self.power *= 3
             self.special_chance = 1
-            logging.debug(f"[{self.name:>{unit_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tMAX ENRAGE (x3 damage, 100% crit chance)")
+            self.attack = self._attack_post_enrage
+            if debug_enabled(logging.DEBUG):
+                logging.debug(f"[{self.name:>{unit_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tMAX ENRAGE (x3 damage, 100% crit chance)")
+
+    def _attack_post_enrage(self, hunter: Hunter) -> None:
+        """Attack the hunter and gain an enrage stack. Used as `Boss.attack()` once max enrage is reached.
+
+        Args:
+            hunter (Hunter): The hunter to attack.
+        """
+        super(Boss, self).attack(hunter)
+        self.apply_enrage(1)
+        if debug_enabled(logging.DEBUG):
+            logging.debug(f"[{self.name:>{unit_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tENRAGE\t{self.enrage_stacks:>6.2f} stacks")
 
     def attack_special(self, hunter: Hunter) -> None:
         """Attack the hunter with a special attack.
@@ -390,18 +479,20 @@ class Boss(Enemy):
             hunter (Hunter): The hunter to attack.
         """
         if self.secondary_attack == 'gothmorgor':
-            if random.random() < self.special_chance:
+            if rand() < self.special_chance:
                 damage = self.power * self.special_damage
                 is_crit = True
-                logging.debug(f"[{self.name:>{unit_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tATTACK\t{damage:>6.2f} SECONDARY (crit)")
+                if debug_enabled(logging.DEBUG):
+                    logging.debug(f"[{self.name:>{unit_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tATTACK\t{damage:>6.2f} SECONDARY (crit)")
             else:
                 damage = self.power
                 is_crit = False
-                logging.debug(f"[{self.name:>{unit_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tATTACK\t{damage:>6.2f} SECONDARY")
+                if debug_enabled(logging.DEBUG):
+                    logging.debug(f"[{self.name:>{unit_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tATTACK\t{damage:>6.2f} SECONDARY")
             hunter.receive_damage(self, damage, is_crit)
-            self.enrage_stacks += 1
+            self.apply_enrage(1)
         elif self.secondary_attack == 'exoscarab':
-            self.enrage_stacks += 5
+            self.apply_enrage(5)
             self.apply_harden(True)
         else:
             raise ValueError(f'Unknown special attack: {self.secondary_attack}')
@@ -413,12 +504,12 @@ class Boss(Enemy):
         if self.harden_ticks_left > 0:
             # Harden effect: 3x regen for 5 ticks
             for _ in range(3):
-                self.heal_hp(regen_value, 'regen')
+                self.heal_hp(regen_value, 'REGEN')
             self.harden_ticks_left -= 1
             if self.harden_ticks_left == 0:
                 self.apply_harden(False)
         else:
-            self.heal_hp(regen_value, 'regen')
+            self.heal_hp(regen_value, 'REGEN')
         # handle death from Ozzy's Gift of Medusa
         if self.is_dead():
             self.on_death()
@@ -436,41 +527,133 @@ class Boss(Enemy):
         else:
             self.damage_reduction = self.previous_dr
 
+    def apply_enrage(self, stacks: int) -> None:
+        """Adds enrage stacks to the boss and updates its speeds accordingly.
+
+        Args:
+            stacks (int): The number of enrage stacks to add.
+        """
+        self.enrage_stacks += stacks
+        self.speed = max((self.base_speed - self.enrage_effect * self.enrage_stacks), 0.5)
+        if self.has_special:
+            self.speed2 = max((self.base_speed2 - self.enrage_effect2 * self.enrage_stacks), 0.5)
+
     def on_death(self) -> None:
         """Extends the Enemy::on_death() method to log enrage stacks on death.
         """
         super(Boss, self).on_death()
         self.sim.hunter.enrage_log.append(self.enrage_stacks)
 
-    @property
-    def speed(self) -> float:
-        """Calculates the speed of the boss, taking enrage stacks into account.
+
+class EnemyBatch:
+    """Struct-of-arrays counterpart of `Enemy` for vectorised simulations. Every attribute of `Enemy` that takes part
+    in combat is stored as an array with one entry per simulated trajectory. Bosses are not supported.
+
+    Stats are stored in single precision by default, which halves the memory traffic of every batch update. Only hp and
+    speed are kept in double precision: hp accumulates damage and regen over the whole fight, and speed is summed into
+    the event times that decide the order of actions.
+    """
+    ### CREATION
+    def __init__(self, hunter: Hunter, stage: int, size: int, dtype: np.dtype = np.float32) -> None:
+        """Creates a batch of enemies of the same stage.
+
+        Args:
+            hunter (Hunter): The hunter that these enemies are fighting.
+            stage (int): The stage of the enemies, for stat selection.
+            size (int): Number of enemies in the batch.
+            dtype (np.dtype, optional): Float type of the stat arrays other than hp and speed, either np.float32 or
+                np.float64. Defaults to np.float32.
+
+        Raises:
+            ValueError: If the stage is a boss stage.
+        """
+        if stage % 100 == 0 and stage > 0:
+            raise ValueError(f'Bosses are not supported in enemy batches: {stage}')
+        hp, power, regen, special_chance, special_damage, damage_reduction, evade_chance, speed = _enemy_stats(hunter, stage).tolist()
+        self.size: int = size
+        self.dtype: np.dtype = np.dtype(dtype)
+        self.hp: np.ndarray = np.full(size, hp, dtype=np.float64)
+        self.max_hp: np.ndarray = np.full(size, hp, dtype=np.float64)
+        self.power: np.ndarray = np.full(size, power, dtype=dtype)
+        self.regen: np.ndarray = np.full(size, regen, dtype=dtype)
+        self.damage_reduction: np.ndarray = np.full(size, damage_reduction, dtype=dtype)
+        self.evade_chance: np.ndarray = np.full(size, evade_chance, dtype=dtype)
+        self.special_chance: np.ndarray = np.full(size, special_chance, dtype=dtype)
+        self.special_damage: np.ndarray = np.full(size, special_damage, dtype=dtype)
+        self.speed: np.ndarray = np.full(size, speed, dtype=np.float64)
+        self.dead: np.ndarray = np.zeros(size, dtype=bool)
+        self.on_create(hunter)
+
+    def on_create(self, hunter: Hunter) -> None:
+        """Executes on creation effects such as Presence of God, Omen of Defeat, and Soul of Snek on the whole batch.
+
+        Args:
+            hunter (Hunter): The hunter that these enemies are fighting.
+        """
+        # the hunter's effects only rescale hp and regen, which works on arrays just the same
+        mods = hunter._mods_mask
+        if mods & MOD_POG:
+            hunter.apply_pog(self)
+        if mods & MOD_OOD:
+            hunter.apply_ood(self)
+        if mods & MOD_SNEK:
+            hunter.apply_snek(self)
+        if mods & MOD_MEDUSA:
+            hunter.apply_medusa(self)
+
+    ### CONTENT
+    def attack_batch(self, rng: np.random.Generator, mask: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Attack the hunter with all enemies selected by `mask`.
+
+        Args:
+            rng (np.random.Generator): Random number generator for the crit rolls.
+            mask (np.ndarray): Boolean array of the enemies that are attacking.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Damage of each attack (0 for enemies that are not attacking) and whether it crit.
         """
-        return max((self._speed - self.enrage_effect * self.enrage_stacks), 0.5)
+        is_crit = mask & (rng.random(self.size, dtype=self.dtype) < self.special_chance)
+        damage = np.where(is_crit, self.power * self.special_damage, self.power) * mask
+        return damage, is_crit
 
-    @speed.setter
-    def speed(self, value: float) -> None:
-        """Sets the speed of the boss.
+    def receive_damage_batch(self, damage: np.ndarray, rng: np.random.Generator, mask: np.ndarray) -> np.ndarray:
+        """Receive damage on all enemies selected by `mask`. Accounts for damage reduction and evade chance.
 
         Args:
-            value (float): The speed of the boss.
+            damage (np.ndarray): Damage to receive, per enemy.
+            rng (np.random.Generator): Random number generator for the evade rolls.
+            mask (np.ndarray): Boolean array of the enemies that are being attacked.
+
+        Returns:
+            np.ndarray: Boolean array of the enemies that died from this damage.
         """
-        self._speed = value
+        hit = mask & (rng.random(self.size, dtype=self.dtype) >= self.evade_chance)
+        np.subtract(self.hp, damage * (1 - self.damage_reduction), out=self.hp, where=hit)
+        return self.on_death_batch(hit & (self.hp <= 0))
+
+    def regen_batch(self, mask: np.ndarray) -> np.ndarray:
+        """Regenerates hp according to the regen stat for all enemies selected by `mask`. Accounts for overhealing.
+
+        Args:
+            mask (np.ndarray): Boolean array of the enemies that regenerate.
 
-    @property
-    def speed2(self) -> float:
-        """Calculates the speed2 of the boss, taking enrage stacks into account.
+        Returns:
+            np.ndarray: Boolean array of the enemies that died from negative regen (Ozzy's Gift of Medusa).
         """
-        return max((self._speed2 - self.enrage_effect2 * self.enrage_stacks), 0.5)
+        np.add(self.hp, np.minimum(self.regen, self.max_hp - self.hp), out=self.hp, where=mask)
+        return self.on_death_batch(mask & (self.hp <= 0))
 
-    @speed2.setter
-    def speed2(self, value: float) -> None:
-        """Sets the speed2 of the boss.
+    def on_death_batch(self, died: np.ndarray) -> np.ndarray:
+        """Marks enemies as dead. Dead enemies are masked out of all further updates by the simulation.
 
         Args:
-            value (float): The speed2 of the boss.
+            died (np.ndarray): Boolean array of the enemies that died.
+
+        Returns:
+            np.ndarray: The `died` array, for chaining.
         """
-        self._speed2 = value
+        self.dead |= died
+        return died
 
 
 if __name__ == "__main__":
@@ -478,7 +661,7 @@ if __name__ == "__main__":
     b.complete_stage(200)
     boss = Boss('E200', b, 200, None) 
     print(boss)
-    boss.enrage_stacks = 11
+    boss.apply_enrage(11)
     print(boss)
     e = Enemy('E199', b, 199, None)
     print(e)
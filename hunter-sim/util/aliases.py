@@ -0,0 +1,7 @@
+import logging
+import random
+
+# log messages are only formatted when the root logger is going to emit them
+debug_enabled = logging.getLogger().isEnabledFor
+# bound once so the combat methods skip the module attribute lookup on every roll
+rand = random.random